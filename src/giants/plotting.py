@@ -1,12 +1,13 @@
 import os
 import numpy as np
+import pandas as pd
 import scipy
 import matplotlib.pyplot as plt
 import matplotlib
-from astropy.coordinates import SkyCoord, Angle
+from matplotlib.collections import LineCollection
+from astropy.coordinates import Angle
 import lightkurve as lk
 import astropy.units as u
-import pickle
 from astroquery.mast import Catalogs
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
@@ -109,7 +110,8 @@ def plot_summary(target, outdir='', save_data=False, save_fig=True,
         aperture_mask = np.zeros(tpf.shape[1:], dtype=bool)
 
     else:
-        lc = target.lc
+        # start from the cleaned light curve, which the PHT HACK below does not modify
+        lc = getattr(target, 'clean_lc', target.lc)
         lcc = target.lcc
         ticid = target.ticid
         tpf = target.tpf
@@ -118,7 +120,7 @@ def plot_summary(target, outdir='', save_data=False, save_fig=True,
 
         mask = target.link_mask[~target.mask]
         try:
-            target.lc = target.lc[mask] # PHT HACK
+            target.lc = lc[mask] # PHT HACK
         except:
             target.lc = target.lc
 
@@ -127,23 +129,24 @@ def plot_summary(target, outdir='', save_data=False, save_fig=True,
     # save the data
     if save_data:
         try:
-            np.savetxt(os.path.join(outdir,'timeseries/'+str(ticid)+'.dat.ts'), np.transpose([lc.time.value, lc.flux.value]), fmt='%.8f', delimiter=' ')
-            np.savetxt(os.path.join(outdir,'fft/'+str(ticid)+'.dat.ts.fft'), np.transpose([freq, fts]), fmt='%.8f', delimiter=' ')
+            save_columns(os.path.join(outdir,'timeseries/'+str(ticid)+'.dat.ts'), lc.time.value, lc.flux.value)
+            save_columns(os.path.join(outdir,'fft/'+str(ticid)+'.dat.ts.fft'), freq, fts)
         except:
-            np.savetxt(os.path.join(outdir,str(ticid)+'.dat.ts'), np.transpose([lc.time.value, lc.flux.value]), fmt='%.8f', delimiter=' ')
-            np.savetxt(os.path.join(outdir,str(ticid)+'.dat.ts.fft'), np.transpose([freq, fts]), fmt='%.8f', delimiter=' ')
+            save_columns(os.path.join(outdir,str(ticid)+'.dat.ts'), lc.time.value, lc.flux.value)
+            save_columns(os.path.join(outdir,str(ticid)+'.dat.ts.fft'), freq, fts)
 
     # fit BLS
-    bls_results, bls_stats, bls_model = get_bls_results(lc)
-    period = bls_results.period[np.argmax(bls_results.power)]
-    t0 = bls_results.transit_time[np.argmax(bls_results.power)]
-    depth = bls_results.depth[np.argmax(bls_results.power)]
+    bls_results, bls_stats, bls_model = get_bls_results(lc, cache=getattr(target, '_bls_cache', None))
+    imax = int(np.argmax(bls_results.power))
+    period = bls_results.period[imax]
+    t0 = bls_results.transit_time[imax]
+    depth = bls_results.depth[imax]
     depth_snr = depth / np.std(lc.flux.value)
     dur = bls_stats['duration'].value * 24.
 
     harmonic_del = bls_stats['harmonic_delta_log_likelihood'].value
-    sde = (bls_results.power - np.mean(bls_results.power)) / np.std(bls_results.power)
-    max_power = max(sde)
+    # signal detection efficiency of the peak, reusing the peak index
+    max_power = (bls_results.power[imax] - np.mean(bls_results.power)) / np.std(bls_results.power)
 
     try:
         bls_model_flux = bls_model.model(lc.time, period, dur / 24., t0)
@@ -257,6 +260,21 @@ def plot_summary(target, outdir='', save_data=False, save_fig=True,
         except:
             fig.savefig(os.path.join(outdir, str(ticid)+'_summary.png'))#, bbox_inches='tight')
 
+def save_columns(path, *columns):
+    """
+    Write arrays to a space-delimited text file, one array per column.
+    Uses the pandas C writer, which is much faster than `numpy.savetxt` for long light curves.
+
+    Parameters
+    ----------
+    path : str
+        Path to the output file.
+    *columns : numpy.ndarray
+        Equal-length arrays to write, formatted to 8 decimal places.
+    """
+    pd.DataFrame(dict(enumerate(columns))).to_csv(path, sep=' ', header=False, index=False, 
+                                                  float_format='%.8f', na_rep='nan')
+
 def fit_transit_model(lc, period, t0):
     """
     Fit a transit model to a given target using the ktransit package.
@@ -346,14 +364,12 @@ def plot_tr_top(flux_lc, model_lc, per, t0, depth, ax):
         Axis to plot on.
     """
 
-    flux_lc.fold(per, t0).remove_outliers().scatter(ax=ax, c='gray', s=125, alpha=0.4, edgecolor='None')
-    flux_lc.fold(per, t0).remove_outliers().bin(.125).scatter(ax=ax, c='dodgerblue', s=720, edgecolor='k')
+    folded_lc = flux_lc.fold(per, t0).remove_outliers()
+    folded_lc.scatter(ax=ax, c='gray', s=125, alpha=0.4, edgecolor='None')
+    folded_lc.bin(.125).scatter(ax=ax, c='dodgerblue', s=720, edgecolor='k')
     
     if model_lc is not None:
 
-        res_flux_ppm = (flux_lc.flux - model_lc.flux.reshape(len(flux_lc.flux))) * 1e6
-        res_lc = lk.LightCurve(time=model_lc.time, flux=res_flux_ppm)
-
         model_lc.fold(per, t0).plot(ax=ax, c='r', lw=3, zorder=10000)
         ax.set_ylim(np.min(model_lc.flux.value)-depth*2, depth*2)
 
@@ -383,8 +399,9 @@ def plot_tr_bottom(flux_lc, model_lc, per, t0, depth, ax):
   
         res_flux_ppm = (flux_lc.flux - model_lc.flux.reshape(len(flux_lc.flux))) * 1e6
         res_lc = lk.LightCurve(time=model_lc.time, flux=res_flux_ppm)
-        res_lc.fold(per, t0).remove_outliers().scatter(ax=ax, c='gray', s=125, alpha=0.4, edgecolor='None')
-        res_lc.fold(per, t0).remove_outliers().bin(.125).scatter(ax=ax, c='dodgerblue', s=720, edgecolor='k')
+        folded_res_lc = res_lc.fold(per, t0).remove_outliers()
+        folded_res_lc.scatter(ax=ax, c='gray', s=125, alpha=0.4, edgecolor='None')
+        folded_res_lc.bin(.125).scatter(ax=ax, c='dodgerblue', s=720, edgecolor='k')
         ax.set_ylim((-depth*2)*1e6, (depth*2)*1e6)
 
     else:
@@ -396,7 +413,9 @@ def plot_tr_bottom(flux_lc, model_lc, per, t0, depth, ax):
 
 def calculate_fft(lc):
     nyq=283.
-    ls = lc.to_periodogram('ls')
+    # only evaluate the periodogram up to the plotted range, and never past the light curve's Nyquist
+    lc_nyquist = 0.5e6 / (86400 * np.median(np.diff(lc.time.value)))
+    ls = lc.to_periodogram('ls', maximum_frequency=min(nyq + 150, lc_nyquist) * u.uHz, ls_method='fast')
     freq = ls.frequency.to(u.uHz).value
     fts = ls.power.value
 
@@ -431,16 +450,18 @@ def plot_fft(freq, fts, ax=None):
     freq = freq[~nanmask]
     fts = fts[~nanmask]
 
-    ax.loglog(freq, fts/np.max(fts), c='dodgerblue')
-    ax.loglog(freq, scipy.ndimage.filters.gaussian_filter(fts/np.max(fts), 5), color='gold', lw=1.5)
-    ax.loglog(freq, scipy.ndimage.filters.gaussian_filter(fts/np.max(fts), 50), color='r', lw=1.5)
+    fts_norm = fts / np.max(fts)
+
+    ax.loglog(freq, fts_norm, c='dodgerblue')
+    ax.loglog(freq, scipy.ndimage.gaussian_filter1d(fts_norm, 5), color='gold', lw=1.5)
+    ax.loglog(freq, scipy.ndimage.gaussian_filter1d(fts_norm, 50), color='r', lw=1.5)
     ax.axvline(283,-1,1, ls='--', color='k')
     ax.set_xlabel("Frequency [uHz]")
     ax.set_ylabel("Power")
     ax.set_xlim(10, 400)
     ax.set_ylim(1e-4, 1e0)
 
-def get_bls_results(lc):
+def get_bls_results(lc, cache=None):
     """
     Get the BLS results for a given light curve.
     
@@ -448,12 +469,20 @@ def get_bls_results(lc):
     ----------
     lc : lightkurve.LightCurve
         Light curve to fit.
+    cache : dict
+        Optional dictionary of previous results, keyed on the light curve contents.
+        Results are looked up and stored here so repeated calls on the same data
+        only run the BLS search once.
         
     Returns
     -------
     results : astropy.stats.BoxLeastSquares
         Astropy BLS object.        
     """
+    if cache is not None:
+        key = (len(lc), hash(lc.time.value.tobytes()), hash(lc.flux.value.tobytes()))
+        if key in cache:
+            return cache[key]
 
     try:
         lc = lc.bin(.5/24).remove_nans()
@@ -476,15 +505,20 @@ def get_bls_results(lc):
     # drop False indicies from lc
     lc = lc[link_mask]
 
+    # durations finer than the 30 minute binning above cannot be resolved
     model = BoxLeastSquares(lc.time, lc.flux)
-    results = model.power(np.linspace(1., 25., 7000), np.linspace(.1, .5, 1000))
+    results = model.power(np.linspace(1., 25., 7000), np.linspace(.1, .5, 20))
 
-    stats = model.compute_stats(results.period[np.argmax(results.power)], 
-                                results.duration[np.argmax(results.power)], 
-                                results.transit_time[np.argmax(results.power)])
+    imax = int(np.argmax(results.power))
+    stats = model.compute_stats(results.period[imax], 
+                                results.duration[imax], 
+                                results.transit_time[imax])
     
-    stats['period'] = results.period[np.argmax(results.power)]
-    stats['duration'] = results.duration[np.argmax(results.power)]
+    stats['period'] = results.period[imax]
+    stats['duration'] = results.duration[imax]
+
+    if cache is not None:
+        cache[key] = results, stats, model
 
     return results, stats, model
 
@@ -502,7 +536,7 @@ def plot_bls(lc, ax, results=None):
         Astropy BLS object.
     """
     if results is None:
-        results, stats = get_bls_results(lc)
+        results = get_bls_results(lc)[0]
     period = results.period[np.argmax(results.power)]
 
     ax.plot(results.period, results.power, "k", lw=0.75)
@@ -512,9 +546,27 @@ def plot_bls(lc, ax, results=None):
 
     #the harmonics of the peak period is highlighted
     ax.axvline(period.value, alpha=0.4, lw=4, c='cornflowerblue')
-    for n in range(2, 10):
-        ax.axvline(n*period.value, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-        ax.axvline(period.value / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+    plot_harmonics(period.value, ax)
+
+def plot_harmonics(period, ax):
+    """
+    Mark the harmonics and subharmonics of a period on a BLS periodogram.
+    All of the lines are drawn as a single artist rather than one `axvline` each.
+
+    Parameters
+    ----------
+    period : float
+        Peak period in days.
+    ax : matplotlib.pyplot.axis
+        Axis to plot on.
+    """
+    n = np.arange(2, 10)
+    harmonics = np.concatenate([n * period, period / n])
+    segments = [[(x, 0), (x, 1)] for x in harmonics]
+
+    lines = LineCollection(segments, transform=ax.get_xaxis_transform(), alpha=0.4, lw=1, 
+                           linestyle="dashed", colors='cornflowerblue')
+    ax.add_collection(lines, autolim=False)
 
 def plot_folded(lc, period, t0, depth, dur, ax):
     """
@@ -536,9 +588,10 @@ def plot_folded(lc, period, t0, depth, dur, ax):
     if ax is None:
         _, ax = plt.subplots(1)
 
-    lc.fold(period, t0).scatter(ax=ax, c='gray', s=75, alpha=0.4,
-                                label=rf'$P={period:.2f}$ d', edgecolor='None')
-    lc.fold(period, t0).bin(.075).plot(ax=ax, c='r', lw=2, zorder=1001)
+    folded_lc = lc.fold(period, t0)
+    folded_lc.scatter(ax=ax, c='gray', s=75, alpha=0.4,
+                      label=rf'$P={period:.2f}$ d', edgecolor='None')
+    folded_lc.bin(.075).plot(ax=ax, c='r', lw=2, zorder=1001)
     ax.scatter(0, -.9 * 3 * depth, c='r', s=150, edgecolors='k', marker='^', zorder=1002)
     ax.plot([-(dur/24.)/2, (dur/24.)/2], [-.9 * 3 * depth, -.9 * 3 * depth], 'r', lw=1.5, zorder=1000)
 
@@ -567,8 +620,9 @@ def plot_odd(lc, period, t0, depth, dur, ax):
     if ax is None:
         _, ax = plt.subplots(1)
 
-    lc.fold(2*period, t0+period/2).scatter(ax=ax, c='gray', label='Odd Transit', s=75, alpha=0.4, edgecolor='None')
-    lc.fold(2*period, t0+period/2).bin(.075).plot(ax=ax, c='r', lw=2, zorder=1002)
+    folded_lc = lc.fold(2*period, t0+period/2)
+    folded_lc.scatter(ax=ax, c='gray', label='Odd Transit', s=75, alpha=0.4, edgecolor='None')
+    folded_lc.bin(.075).plot(ax=ax, c='r', lw=2, zorder=1002)
     ax.scatter(period/2, -.9 * 3 * depth, c='r', s=150, edgecolors='k', marker='^', zorder=1001)
     ax.plot([.5*period-(dur/24.)/2, .5*period+(dur/24.)/2], [-.9 * 3 * depth, -.9 * 3 * depth], 'r', lw=1.5, zorder=1000)
 
@@ -598,8 +652,9 @@ def plot_even(lc, period, t0, depth, dur, ax):
     if ax is None:
         _, ax = plt.subplots(1)
 
-    lc.fold(2*period, t0+period/2).scatter(ax=ax, c='gray', label='Even Transit', s=75, alpha=0.4, edgecolor='None')
-    lc.fold(2*period, t0+period/2).bin(.075).plot(ax=ax, c='r', lw=2, zorder=1002)
+    folded_lc = lc.fold(2*period, t0+period/2)
+    folded_lc.scatter(ax=ax, c='gray', label='Even Transit', s=75, alpha=0.4, edgecolor='None')
+    folded_lc.bin(.075).plot(ax=ax, c='r', lw=2, zorder=1002)
     ax.scatter(-period/2, -.9 * 3 * depth, c='r', s=150, edgecolors='k', marker='^', zorder=1001)
     ax.plot([-.5*period-(dur/24.)/2, -.5*period+(dur/24.)/2], [-.9 * 3 * depth, -.9 * 3 * depth], 'r', lw=1.5, zorder=1000)
 
@@ -644,14 +699,17 @@ def plot_diff_image(tpf, lcc, per, t0, dur, ax):
     n_transits = round((lcc[-1].time.value[-1] - lcc[0].time.value[0]) / per)
     transit_times = t0 + np.arange(n_transits) * per
 
+    tpf_time = tpf.time.value
+    half_dur = (dur/2)/24.
+
     resid_frames = []
     try:
-        for tt in transit_times[transit_times < tpf.time.value[-1]]:
+        for tt in transit_times[transit_times < tpf_time[-1]]:
             try:
-                t_frames = np.where([np.min(np.abs(tt - t)) < (dur/2)/24. for t in tpf.time.value])
-                nt_frames = np.where([np.min(np.abs(tt + (dur/24.) - t)) < (dur/2)/24. for t in tpf.time.value])
+                # select in-transit cadences and the same span one duration later
+                t_frames = np.flatnonzero(np.abs(tt - tpf_time) < half_dur)
+                nt_frames = np.flatnonzero(np.abs(tt + (dur/24.) - tpf_time) < half_dur)
                 if t_frames.size > 0 and nt_frames.size > 0:
-                    print('yo'*50)
                     rf = np.nanmean(tpf.flux.value[t_frames], axis=0) - np.nanmean(tpf.flux.value[nt_frames], axis=0)
                 else:
                     print("Warning: t_frames or nt_frames is empty. Skipping residual flux calculation.")
@@ -806,7 +864,8 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
     matplotlib.rc('font', **font)
     plt.style.use('seaborn-v0_8-muted')
 
-    lc = target.lc
+    # start from the cleaned light curve, which the PHT HACK below does not modify
+    lc = getattr(target, 'clean_lc', target.lc)
     lcc = target.lcc
     ticid = target.ticid
     tpf = target.tpf
@@ -815,15 +874,16 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
 
     mask = target.link_mask[~target.mask]
     try:
-        target.lc = target.lc[mask] # PHT HACK
+        target.lc = lc[mask] # PHT HACK
     except:
         target.lc = target.lc
 
     if period is None:
-        bls_results, bls_stats = get_bls_results(lc)
-        period = bls_results.period[np.argmax(bls_results.power)].value
-        t0 = bls_results.transit_time[np.argmax(bls_results.power)].value
-        depth = bls_results.depth[np.argmax(bls_results.power)].value
+        bls_results, bls_stats, _ = get_bls_results(lc, cache=getattr(target, '_bls_cache', None))
+        imax = int(np.argmax(bls_results.power))
+        period = bls_results.period[imax].value
+        t0 = bls_results.transit_time[imax].value
+        depth = bls_results.depth[imax].value
         depth_snr = depth / np.std(lc.flux.value)
         dur = bls_stats['duration'].value * 24.
 
@@ -975,9 +1035,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         ax.plot(bls_center.period, bls_center.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue', label='OG period')
         ax.legend(loc='upper right')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -987,9 +1045,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         ax.plot(bls_ul.period, bls_ul.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue', label='OG period')
         ax.legend(loc='upper right')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -999,9 +1055,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         ax.plot(bls_ur.period, bls_ur.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue', label='OG period')
         ax.legend(loc='upper right')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1011,9 +1065,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         ax.plot(bls_ll.period, bls_ll.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue', label='OG period')
         ax.legend(loc='upper right')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1023,9 +1075,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         ax.plot(bls_lr.period, bls_lr.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue', label='OG period')
         ax.legend(loc='upper right')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1099,9 +1149,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         bls_2x2 = get_bls_results(lc_2x2)[0]
         ax.plot(bls_2x2.period, bls_2x2.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1110,9 +1158,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         bls_4x4 = get_bls_results(lc_4x4)[0]
         ax.plot(bls_4x4.period, bls_4x4.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1121,9 +1167,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         bls_6x6 = get_bls_results(lc_6x6)[0]
         ax.plot(bls_6x6.period, bls_6x6.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1132,9 +1176,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         bls_8x8 = get_bls_results(lc_8x8)[0]
         ax.plot(bls_8x8.period, bls_8x8.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1143,9 +1185,7 @@ def plot_vetting_summary(target, outdir='', period=None, t0=None, save_fig=True,
         bls_10x10 = get_bls_results(lc_10x10)[0]
         ax.plot(bls_10x10.period, bls_10x10.power, "k", lw=1)
         ax.axvline(period, alpha=0.4, lw=4, c='cornflowerblue')
-        for n in range(2, 10):
-            ax.axvline(n*period, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
-            ax.axvline(period / n, alpha=0.4, lw=1, linestyle="dashed", c='cornflowerblue')
+        plot_harmonics(period, ax)
         ax.set_xlim(bls_results.period.min().value, bls_results.period.max().value)
         ax.set_xlabel("period [days]")
         ax.set_ylabel("log likelihood")
@@ -1,17 +1,15 @@
 import os
 import re
-import glob
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import pandas as pd
-import scipy
 import lightkurve as lk
 import warnings
 import astropy.units as u
 from tess_stars2px import tess_stars2px_function_entry
 from astroquery.mast import Catalogs
 from astropy.coordinates import SkyCoord
-from astropy.config import set_temp_cache
+from astropy.stats import sigma_clip
 
 from . import PACKAGEDIR
 from .plotting import plot_summary
@@ -22,6 +20,12 @@ warnings.filterwarnings("ignore", category=FutureWarning)
 
 __all__ = ['Target']
 
+# matches the first integer in a TIC ID or sector description
+_DIGITS_RE = re.compile(r'\d+')
+
+# spacecraft data downlink times (BTJD)
+_DOWNLINKS = np.loadtxt(os.path.join(PACKAGEDIR, 'data/downlinks.txt'))
+
 class Target(object):
     """
     A class to hold a TESS target and its data.
@@ -39,11 +43,12 @@ class Target(object):
         # parse TIC ID
         self.ticid = ticid
         if isinstance(self.ticid, str):
-            self.ticid = int(re.search(r'\d+', str(self.ticid)).group())
+            self.ticid = int(_DIGITS_RE.search(self.ticid).group())
 
         self.PACKAGEDIR = PACKAGEDIR
         self.has_target_info = False
         self.silent = silent
+        self._bls_cache = {}
 
         if target_info is None:
             self.get_target_info(self.ticid)
@@ -106,9 +111,8 @@ class Target(object):
         else:
             self.search_result = lk.search_tesscut(f'TIC {self.ticid}')
         
-        available_sectors = []
-        for sector in self.search_result.table['description']:
-            available_sectors.append(int(re.search(r'\d+', sector).group()))
+        available_sectors = [int(_DIGITS_RE.search(sector).group())
+                             for sector in self.search_result.table['description']]
 
         return available_sectors
     
@@ -172,10 +176,9 @@ class Target(object):
 
         self.link_mask = []
         self.lcc = lk.LightCurveCollection([])
-        self.breakpoints = []
         self.used_sectors = []
 
-        lc = None
+        raw_lcs = []
         
         # apply the pca background correction
         for tpf in tpfc:
@@ -195,22 +198,22 @@ class Target(object):
                                                   aperture_mask=aperture_mask, n_pca=n_pca, pipeline_call=True)
                 new_raw_lc = tpf.to_lightcurve(aperture_mask=aperture_mask)
 
-                # stitch together
-                if lc is None:
+                # keep the first usable cutout for plotting
+                if len(self.lcc) == 0:
                     self.tpf = tpf
                     self.aperture_mask = aperture_mask
-                    lc = new_lc
-                    raw_lc = new_raw_lc
-                else:
-                    lc = lc.append(new_lc)
-                    raw_lc = raw_lc.append(new_raw_lc)
 
-                self.breakpoints.append(new_lc.time[-1])
                 self.used_sectors.append(tpf.sector)
                 self.lcc.append(new_lc)
+                raw_lcs.append(new_raw_lc)
             except:
                 continue
 
+        # stitch together all sectors at once
+        lc = self.lcc[0].append(self.lcc[1:])
+        self.breakpoints = np.array([sector_lc.time.value[-1] for sector_lc in self.lcc])
+        raw_lc = raw_lcs[0].append(raw_lcs[1:])
+
         self.lc = lc
         self.raw_lc = raw_lc
         self.link_mask = np.concatenate(self.link_mask)
@@ -238,21 +241,17 @@ class Target(object):
         if sectors is None:
             sectors = self.available_sectors
 
-        tpfs = []
+        # create the shared output directory up front so concurrent cutouts don't race to make it
+        out_path = f'/home/nsaunders/mendel-nas1/cutout_files/tic{self.ticid}'
+        os.makedirs(out_path, exist_ok=True)
 
-        ffi_path = '/shared_data/osn/astro-tessdata/ffi/'
-
-        for i, sector in enumerate(sectors):
+        def cut_sector(i, sector):
             cam = self.cameras[i]
             ccd = self.ccds[i]
 
-            fits_image_paths = glob.glob(os.path.join(ffi_path, f's{sector:04}/*/*/{cam}-{ccd}/*.fits'))
-            fits_image_paths.sort()
-
             try:
                 my_cutter = astrocut.CutoutFactory()
 
-                out_path = f'/home/nsaunders/mendel-nas1/cutout_files/tic{self.ticid}'
                 cutout_file = my_cutter.cube_cut(f's3://stpubdata/tess/public/mast/tess-s{sector:04}-{cam}-{ccd}-cube.fits', 
                                                  self.coords, 11, output_path=out_path)
 
@@ -260,10 +259,14 @@ class Target(object):
 
                 file_to_remove = pathlib.Path(cutout_file)
                 file_to_remove.unlink()
-                tpfs.append(tpf)
+                return tpf
 
             except:
-                continue
+                return None
+
+        # each sector is an independent S3 read, so cut them out concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(sectors)))) as executor:
+            tpfs = [tpf for tpf in executor.map(cut_sector, range(len(sectors)), sectors) if tpf is not None]
 
         tpfc = lk.TargetPixelFileCollection(tpfs)
 
@@ -274,10 +277,9 @@ class Target(object):
 
         self.link_mask = []
         self.lcc = lk.LightCurveCollection([])
-        self.breakpoints = []
         self.used_sectors = []
     
-        lc = None
+        raw_lcs = []
 
         # apply the pca background correction
         for tpf in tpfc:
@@ -297,22 +299,22 @@ class Target(object):
                                                     aperture_mask=aperture_mask, n_pca=n_pca, pipeline_call=True)
                 new_raw_lc = tpf.to_lightcurve(aperture_mask=aperture_mask)
 
-                # stitch together
-                if lc is None:
+                # keep the first usable cutout for plotting
+                if len(self.lcc) == 0:
                     self.tpf = tpf
                     self.aperture_mask = aperture_mask
-                    lc = new_lc
-                    raw_lc = new_raw_lc
-                else:
-                    lc = lc.append(new_lc)
-                    raw_lc = raw_lc.append(new_raw_lc)
 
-                self.breakpoints.append(new_lc.time[-1])
                 self.used_sectors.append(tpf.sector)
                 self.lcc.append(new_lc)
+                raw_lcs.append(new_raw_lc)
             except:
                 continue
 
+        # stitch together all sectors at once
+        lc = self.lcc[0].append(self.lcc[1:])
+        self.breakpoints = np.array([sector_lc.time.value[-1] for sector_lc in self.lcc])
+        raw_lc = raw_lcs[0].append(raw_lcs[1:])
+
         self.lc = lc
         self.raw_lc = raw_lc
         self.link_mask = np.concatenate(self.link_mask)
@@ -372,13 +374,14 @@ class Target(object):
 
         # store as LCC for plotting later
         self.lcc = lk.LightCurveCollection([lc])
-        self.breakpoints = [lc.time[-1]]
         for tpf in tpfc[1:]:
             new_lc = self.apply_pca_corrector(tpf, flatten=flatten, zero_point_background=zero_point_background, 
                                               aperture_mask=None, n_pca=n_pca)
-            self.breakpoints.append(new_lc.time[-1])
             self.lcc.append(new_lc)
-            lc = lc.append(new_lc)
+
+        # stitch together all sectors at once
+        lc = self.lcc[0].append(self.lcc[1:])
+        self.breakpoints = np.array([sector_lc.time.value[-1] for sector_lc in self.lcc])
 
         self.lc = lc
 
@@ -475,7 +478,7 @@ class Target(object):
         tpf = tpf[mask]
 
         # create design matrix from pixels outside of aperture
-        regressors = tpf.flux[:, ~aperture_mask]
+        regressors = tpf.flux.value[:, ~aperture_mask]
         dm = lk.DesignMatrix(regressors, name='regressors')
 
         # perform PCA on design matrix and append column of constants
@@ -483,7 +486,8 @@ class Target(object):
         dm = dm.append_constant()
 
         # fit weights to design matrix and remove background noise model
-        corrector = lk.RegressionCorrector(raw_lc.normalize())
+        norm_lc = raw_lc.normalize()
+        corrector = lk.RegressionCorrector(norm_lc)
         corrected_lc_unnormalized = corrector.correct(dm)
         model = corrector.model_lc
 
@@ -494,7 +498,7 @@ class Target(object):
         if zero_point_background:
             model -= np.percentile(model.flux, 5)
 
-        corrected_lc = lk.LightCurve(time=model.time, flux=raw_lc.normalize().flux.value-model.flux.value, flux_err=raw_lc.flux_err.value)
+        corrected_lc = lk.LightCurve(time=model.time, flux=norm_lc.flux.value-model.flux.value, flux_err=raw_lc.flux_err.value)
 
         if flatten:
             if tpf.sector <= 27:
@@ -551,27 +555,32 @@ class Target(object):
     
     def _clean_data(self, lc):
         """Hidden function to remove common sources of noise and outliers."""
-        # mask first 12h after momentum dump
-        momdump = (lc.time.value > 1339) * (lc.time.value < 1341)
+        time = lc.time.value
+
+        # mask first 12h after momentum dump, building a single mask in place
+        mask = (time > 1339) & (time < 1341)
 
         # also the burn in
-        burnin = np.zeros_like(lc.time.value, dtype=bool)
-        burnin[:30] = True
-        with open(os.path.join(self.PACKAGEDIR, 'data/downlinks.txt')) as f:
-            downlinks = [float(val.strip()) for val in f.readlines()]
-        """
-        # mask around downlinks
-        for d in downlinks:
-            if d in lc.time:
-                burnin[d:d+15] = True
-        """
-        # also 6 sigma outliers
-        _, outliers = lc.remove_outliers(sigma=6, return_mask=True)
-        mask = momdump | outliers | burnin
+        mask[:30] = True
+
+        # mask the 15 cadences following each downlink
+        idx = np.searchsorted(time, _DOWNLINKS)
+        covered = (idx > 0) & (idx < len(time))
+        # skip downlinks in gaps between observed sectors, where the next cadence is weeks away
+        near = idx[covered]
+        covered[covered] = ((time[near] - _DOWNLINKS[covered] < 2.) &
+                            (_DOWNLINKS[covered] - time[near - 1] < 2.))
+        idx = idx[covered]
+        window = (idx[:, None] + np.arange(15)).ravel()
+        mask[window[window < len(time)]] = True
+
+        # also 6 sigma outliers, taking the clip mask directly instead of a clipped copy of lc
+        mask |= sigma_clip(lc.flux.value, sigma=6).mask
         lc = lc[~mask]
 
-        # store cleaned lc
+        # store cleaned lc, keeping an untouched copy for the plotting routines
         self.lc = lc
+        self.clean_lc = lc
         self.mask = mask
         return lc
     
@@ -1,3 +1,6 @@
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 import lightkurve as lk
 import astropy.units as u
@@ -46,7 +49,42 @@ def get_cutout(ticid, cutout_size=9):
 
     return tpf
 
-def build_ktransit_model(lc, period, t0, rprs=0.02, vary_transit=True):
+def _fit_ktransit(time, flux, ferr, period, t0, rprs, vary_transit):
+    """
+    Run a single ktransit fit from a given starting ephemeris.
+
+    Returns
+    -------
+    fitT : ktransit.fittransit.FitTransit
+        ktransit model fit to the light curve.
+    """
+    from ktransit import FitTransit
+    fitT = FitTransit()
+
+    fitT.add_guess_star(rho=0.022, zpt=0, ld1=0.6505,ld2=0.1041) 
+    fitT.add_guess_planet(T0=t0, period=period, impact=0.5, rprs=rprs)
+
+    fitT.add_data(time=time,flux=flux,ferr=ferr)
+
+    vary_star = ['zpt']      # free stellar parameters
+    if vary_transit:
+        vary_planet = (['period', 'impact',       # free planetary parameters
+            'T0', #'esinw', 'ecosw',
+            'rprs']) #'impact',               # free planet parameters are the same for every planet you model
+    else:
+        vary_planet = (['rprs'])
+
+    fitT.free_parameters(vary_star, vary_planet)
+    fitT.do_fit()                   # run the fitting
+
+    return fitT
+
+def _ktransit_chisq(time, flux, ferr, period, t0, rprs, vary_transit):
+    """Fit from one starting ephemeris and return the chi-squared of the result."""
+    fitT = _fit_ktransit(time, flux, ferr, period, t0, rprs, vary_transit)
+    return np.sum(((flux - fitT.transitmodel) / ferr)**2)
+
+def build_ktransit_model(lc, period, t0, rprs=0.02, vary_transit=True, multistart=False):
     """
     Create a ktransit model for a given target and fit it to the light curve.
 
@@ -62,36 +100,35 @@ def build_ktransit_model(lc, period, t0, rprs=0.02, vary_transit=True):
         Time of first transit.
     rprs : float
         Radius of the planet in units of the stellar radius. Default is 0.02.
+    multistart : bool
+        Optionally fit from a grid of 15 starting ephemerides around `period` and `t0`
+        in parallel processes, and keep the start with the lowest chi-squared.
+        Only used when `vary_transit` is True. Default is False.
         
     Returns
     -------
     fitT : ktransit.fittransit.FitTransit
         ktransit model fit to the light curve.
     """
-    from ktransit import FitTransit
-    fitT = FitTransit()
-
     t0 = t0.value
     period = period.value
 
-    fitT.add_guess_star(rho=0.022, zpt=0, ld1=0.6505,ld2=0.1041) 
-    fitT.add_guess_planet(T0=t0, period=period, impact=0.5, rprs=rprs)
+    time = lc.time.value
+    flux = lc.flux.value
+    ferr = np.full_like(time, 1e-5)
 
-    ferr = np.ones_like(lc.time.value) * 0.00001
-    fitT.add_data(time=lc.time.value,flux=lc.flux.value,ferr=ferr)
+    if multistart and vary_transit:
+        starts = [(period * pf, t0 + dt) for dt in np.linspace(-0.1, 0.1, 5) for pf in (0.99, 1.0, 1.01)]
+        n = len(starts)
+        with ProcessPoolExecutor() as executor:
+            chisq = list(executor.map(_ktransit_chisq, repeat(time, n), repeat(flux, n), repeat(ferr, n),
+                                      [p for p, _ in starts], [t for _, t in starts], 
+                                      repeat(rprs, n), repeat(vary_transit, n)))
 
-    vary_star = ['zpt']      # free stellar parameters
-    if vary_transit:
-        vary_planet = (['period', 'impact',       # free planetary parameters
-            'T0', #'esinw', 'ecosw',
-            'rprs']) #'impact',               # free planet parameters are the same for every planet you model
-    else:
-        vary_planet = (['rprs'])
+        # refit from the best start here, so the returned model lives in this process
+        period, t0 = starts[int(np.argmin(chisq))]
 
-    fitT.free_parameters(vary_star, vary_planet)
-    fitT.do_fit()                   # run the fitting
-
-    return fitT
+    return _fit_ktransit(time, flux, ferr, period, t0, rprs, vary_transit)
 
 def _individual_ktransit_dur(time, data):
     """ 
@@ -116,13 +153,36 @@ def _individual_ktransit_dur(time, data):
 
     return dur
 
-def parse_sectors(lc):
+@functools.lru_cache(maxsize=None)
+def _load_orbit_times():
+    """
+    Read the TESS orbit times table once and reduce it to per-sector start and end times.
 
-    times_df = pd.read_csv(os.path.join(PACKAGEDIR, 'data/TESS_orbit_times.csv'))
+    Returns
+    -------
+    sector_list : numpy.ndarray
+        Sector numbers covered by the table.
+    start_times : numpy.ndarray
+        Start of the first orbit of each sector in BTJD.
+    end_times : numpy.ndarray
+        End of the last orbit of each sector in BTJD.
+    """
+    times_df = pd.read_csv(os.path.join(PACKAGEDIR, 'data/TESS_orbit_times.csv')).iloc[:-1]
+
+    orbits = pd.DataFrame({'sector': np.array(times_df['Sector'], dtype=int),
+                           'start': Time(list(times_df['Start of Orbit'])).jd - 2457000,
+                           'end': Time(list(times_df['End of Orbit'])).jd - 2457000})
+    grouped = orbits.groupby('sector')
+
+    sector_list = grouped.size().index.values
+    start_times = grouped['start'].first().values
+    end_times = grouped['end'].last().values
+
+    return sector_list, start_times, end_times
+
+def parse_sectors(lc):
 
-    sector_list = np.unique(np.array(times_df['Sector'].iloc[:-1], dtype=int))
-    start_times = np.array([Time(times_df[times_df['Sector'] == str(s)]['Start of Orbit'].iloc[0]).jd - 2457000 for s in sector_list])
-    end_times = np.array([Time(times_df[times_df['Sector'] == str(s)]['End of Orbit'].iloc[-1]).jd - 2457000 for s in sector_list])
+    sector_list, start_times, end_times = _load_orbit_times()
 
     lcc = lk.LightCurveCollection([])
     sectors = []